@@ -0,0 +1,44 @@
+"""Functions under test shared by the sync and async examples."""
+
+
+def multiply(x: int, y: int):
+    """Multiplies x by y
+
+    Args:
+        x (int): value
+        y (int): value
+    """
+    return x + y
+
+
+def obscure_multiply(x: int, y: int) -> int:
+    """Multiplies x by y.
+
+    Args:
+        x (int): value
+        y (int): value
+
+    Returns:
+        int: x times y
+    """
+
+    def add(a: int, b: int) -> int:
+        while b != 0:
+            carry = a & b
+            a = a ^ b
+            b = carry << 1
+        return a
+
+    def shift_add_multiply(a: int, b: int) -> int:
+        negative = b < 0
+        if negative:
+            b = -b
+        result = 0
+        while b != 0:
+            if b & 1:
+                result = add(result, a)
+            a = add(a, a)
+            b >>= 1
+        return -result if negative else result
+
+    return shift_add_multiply(x, y)
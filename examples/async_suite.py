@@ -1,58 +1,23 @@
 import asyncio
-from suite import async_suite
-
-tester = async_suite(model_name="openrouter/openai/o3-mini", debug=True)
-
-
-def multiply(x: int, y: int):
-    """Multiplies x by y
-
-    Args:
-        x (int): value
-        y (int): value
-    """
-    return x + y
+from concurrent.futures import ThreadPoolExecutor
 
+from _shared import multiply, obscure_multiply
 
-def obscure_multiply(x: int, y: int) -> int:
-    """Multiplies x by y.
-
-    Args:
-        x (int): value
-        y (int): value
-
-    Returns:
-        int: x times y
-    """
+from suite import async_suite
 
-    def add(a: int, b: int) -> int:
-        while b != 0:
-            carry = a & b
-            a = a ^ b
-            b = carry << 1
-        return a
+tester = async_suite(model_name="openrouter/openai/o3-mini", debug=True)
 
-    def recursive_multiply(a: int, b: int) -> int:
-        if b == 0:
-            return 0
-        elif b < 0:
-            return -recursive_multiply(a, -b)
-        elif b == 1:
-            return a
-        else:
-            half = recursive_multiply(a, b // 3)
-            if b % 2 == 0:
-                return add(half, half)
-            else:
-                return add(add(half, half), a)
 
-    return recursive_multiply(x, y)
+async def main():
+    # Bound the threads used to analyze the functions under test
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=8))
 
+    # Tasks start running right away, so both evaluations overlap
+    tasks = [asyncio.create_task(tester(f)) for f in (obscure_multiply, multiply)]
+    om_resp, m_resp = await asyncio.gather(*tasks, return_exceptions=True)
 
-async def main():
-    om_resp = tester(obscure_multiply)  # Await the async call
-    m_resp = tester(multiply)  # Await the async call
-    await asyncio.gather(om_resp, m_resp)
+    print(om_resp)
+    print(m_resp)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,11 @@
 import json
 import logging
+import os
 from typing import Callable
 import llm
 from pydantic import BaseModel
 
-from suite.analyzer import FunctionInfo
+from suite.analyzer import FunctionInfo, build_dependency_tree_async
 
 
 logging.basicConfig(
@@ -128,6 +129,7 @@ class suite:
         prompt_template: str = DEFAULT_PROMPT_TEMPLATE,
         dependencies_template: str = DEFAULT_DEPENDENCY_TEMPLATE,
         debug=False,
+        cache_dir: str | os.PathLike | None = None,
     ):
         self.model_name = model_name
         self.model = llm.get_model(model_name)
@@ -136,6 +138,7 @@ class suite:
         self.prompt_template = prompt_template
         self.dependencies_template = dependencies_template
         self.debug = debug
+        self.cache_dir = cache_dir
 
     def __call__(self, func: Callable) -> SuiteOutput:
         """Evaluate the function against its docstring using the LLM model.
@@ -146,7 +149,9 @@ class suite:
         Returns:
             SuiteOutput: The result of the evaluation, including reasoning and pass/fail status.
         """
-        func_info = FunctionInfo.from_func(func, max_depth=self.max_depth)
+        func_info = FunctionInfo.from_func(
+            func, max_depth=self.max_depth, cache_dir=self.cache_dir
+        )
         prompt = format_prompt(
             func_info, self.prompt_template, self.dependencies_template
         )
@@ -171,6 +176,7 @@ class async_suite:
         prompt_template: str = DEFAULT_PROMPT_TEMPLATE,
         dependencies_template: str = DEFAULT_DEPENDENCY_TEMPLATE,
         debug=False,
+        cache_dir: str | os.PathLike | None = None,
     ):
         self.model_name = model_name
         self.model = llm.get_async_model(model_name)  # Use async model
@@ -179,6 +185,7 @@ class async_suite:
         self.prompt_template = prompt_template
         self.dependencies_template = dependencies_template
         self.debug = debug
+        self.cache_dir = cache_dir
 
     async def __call__(self, func: Callable) -> SuiteOutput:
         """
@@ -191,7 +198,10 @@ class async_suite:
             SuiteOutput: The result of the evaluation, including reasoning and pass/fail status.
         """
 
-        func_info = FunctionInfo.from_func(func, max_depth=self.max_depth)
+        # Analyze the code in threads to keep the event loop free
+        func_info = await build_dependency_tree_async(
+            func, max_depth=self.max_depth, cache_dir=self.cache_dir
+        )
         prompt = format_prompt(
             func_info, self.prompt_template, self.dependencies_template
         )
@@ -3,14 +3,41 @@ Code analysis utilities for the Suite pytest plugin.
 """
 
 import ast
+import asyncio
+import dataclasses
+import functools
+import hashlib
 import inspect
+import os
+import pickle
+import re
+import sys
+import tempfile
 import textwrap
+from collections.abc import Collection, Generator, Hashable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from types import CodeType
 from typing import Any, Callable
 
-from pydantic import BaseModel
+# Only the AST is needed, already optimized when supported (Python 3.13+)
+_AST_FLAGS = getattr(ast, "PyCF_OPTIMIZED_AST", ast.PyCF_ONLY_AST)
+
+# Sources up to this length are interned, bigger ones are rarely duplicated
+_MAX_INTERNED_SOURCE = 4096
+
+# Version of the on-disk cache entries, bump it when FunctionInfo or the entry
+# layout changes so old entries are never loaded
+_CACHE_VERSION = 2
+
+# Directories where third-party packages are installed
+_THIRD_PARTY_DIRS = frozenset({"site-packages", "dist-packages"})
 
 
 def get_callable_name(func: Callable) -> str:
+    # Look through wrapper objects, e.g. numba dispatchers
+    if hasattr(func, "__wrapped__"):
+        func = inspect.unwrap(func)
     if inspect.isclass(func):
         return func.__name__
     elif inspect.isfunction(func):
@@ -20,7 +47,8 @@ def get_callable_name(func: Callable) -> str:
     raise ValueError(f"Couldn't extract the name of the object {func}")
 
 
-class FunctionInfo(BaseModel):
+@dataclass(slots=True)
+class FunctionInfo:
     """
     Represents metadata and dependency information about a Python function.
 
@@ -33,11 +61,12 @@ class FunctionInfo(BaseModel):
         docstring (str | None): The docstring of the function, if available.
         source (str | None): The full source code of the function, if retrievable.
         source_file (str | None): The file path where the function is defined.
+        line_number (int | None): The line where the function definition starts.
         dependencies (list[FunctionInfo]): A list of `FunctionInfo` objects representing
             other functions called by this function (dependencies), determined statically.
 
     Class Methods:
-        from_func(func, max_depth=2, current_depth=0, visited=None, skip_implementation=False):
+        from_func(func, max_depth=2, cache_dir=None):
             Constructs a `FunctionInfo` object from a Python callable, with optional
             recursive analysis of its dependencies.
 
@@ -51,15 +80,19 @@ class FunctionInfo(BaseModel):
     docstring: str | None
     source: str | None
     source_file: str | None
-    dependencies: list["FunctionInfo"] = []
+    line_number: int | None = None
+    dependencies: list["FunctionInfo"] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the function information, dependencies included, to a dict."""
+        return asdict(self)
 
     @classmethod
     def from_func(
         cls,
         func: Callable,
         max_depth: int = 2,
-        current_depth: int = 0,
-        visited: set[str] | None = None,
+        cache_dir: str | os.PathLike | None = None,
     ) -> "FunctionInfo":
         """
         Create a `FunctionInfo` instance from a Python function, with optional
@@ -67,15 +100,13 @@ class FunctionInfo(BaseModel):
 
         This method uses introspection and AST analysis to extract metadata about
         the given function and any other functions it calls (dependencies), up to a
-        specified recursion depth.
+        specified recursion depth. See `build_dependency_tree`.
 
         Args:
             func (Callable): The function to analyze.
             max_depth (int, optional): Maximum depth of dependency analysis. Defaults to 2.
-            current_depth (int, optional): Internal parameter used for tracking the
-                current recursion depth. Defaults to 0.
-            visited (set[str] | None, optional): Set of function names already visited to
-                avoid circular dependencies. Defaults to None.
+            cache_dir (str | os.PathLike | None, optional): Directory where dependency
+                trees are cached. Defaults to None (no cache).
 
         Returns:
             FunctionInfo: An object containing metadata about the function and its dependencies.
@@ -88,67 +119,417 @@ class FunctionInfo(BaseModel):
             >>> FunctionInfo.from_func(foo)
             FunctionInfo(name='foo', docstring=None, ...)
         """
-        if visited is None:
-            visited = set()
-        name = get_callable_name(func)
-        docstring = extract_docstring(func)
-        source = extract_source(func)
-        source_file = extract_source_file(func)
-
-        # Stop recursion if we've reached the maximum depth
-        if current_depth >= max_depth or name in visited:
-            return cls(
-                name=name,
-                docstring=docstring,
-                source=source,
-                source_file=source_file,
-                dependencies=[],
+        return build_dependency_tree(func, max_depth=max_depth, cache_dir=cache_dir)
+
+
+# Where a node goes: (parent node, index in its dependencies)
+_Slot = tuple[FunctionInfo | None, int]
+# Functions of one tree level: (function, parent node, index in its dependencies)
+_Frontier = list[tuple[Callable, FunctionInfo | None, int]]
+# Functions of one tree level left to analyze: func_key -> (function, slots)
+_Pending = dict[Hashable, tuple[Callable, list[_Slot]]]
+# Functions built at earlier levels: func_key -> node
+_Seen = dict[Hashable, FunctionInfo]
+# How the calls of an expanded node were resolved:
+# (module name, called names, called name -> func_key)
+_Resolution = tuple[str | None, frozenset[str], dict[str, Hashable]]
+
+
+def build_dependency_tree(
+    func: Callable, max_depth: int = 2, cache_dir: str | os.PathLike | None = None
+) -> FunctionInfo:
+    """Build the dependency tree of a function, breadth first.
+
+    Functions reached more than once from the same level of the tree are built
+    once and shared between their callers, so the result is a DAG in memory.
+    Functions reached again at a later level than the one they were built at
+    (e.g. recursion, or a helper called both directly and through another
+    function) end in a copy of that function without dependencies.
+
+    With `cache_dir`, the tree is also saved to disk and reused by later calls
+    until any of the source files it was built from changes.
+
+    Args:
+        func (Callable): The function to analyze.
+        max_depth (int, optional): Maximum depth of dependency analysis. Defaults to 2.
+        cache_dir (str | os.PathLike | None, optional): Directory where dependency
+            trees are cached, e.g. `default_cache_dir()`. Defaults to None (no cache).
+
+    Returns:
+        FunctionInfo: The root of the dependency tree.
+    """
+    cache_path = _cache_path(func, max_depth, cache_dir)
+    if cache_path is not None and (tree := _load_cached_tree(cache_path)):
+        return tree
+
+    walk = _walk_tree(func, max_depth)
+    try:
+        jobs = next(walk)
+        while True:
+            jobs = walk.send([job() for job in jobs])
+    except StopIteration as stop:
+        tree, resolutions = stop.value
+
+    if cache_path is not None:
+        _store_cached_tree(cache_path, tree, resolutions)
+    return tree
+
+
+async def build_dependency_tree_async(
+    func: Callable, max_depth: int = 2, cache_dir: str | os.PathLike | None = None
+) -> FunctionInfo:
+    """Build the dependency tree of a function without blocking the event loop.
+
+    Same as `build_dependency_tree`, but each function is analyzed with
+    `asyncio.to_thread` and each level of the tree is gathered concurrently.
+
+    Args:
+        func (Callable): The function to analyze.
+        max_depth (int, optional): Maximum depth of dependency analysis. Defaults to 2.
+        cache_dir (str | os.PathLike | None, optional): Directory where dependency
+            trees are cached, e.g. `default_cache_dir()`. Defaults to None (no cache).
+
+    Returns:
+        FunctionInfo: The root of the dependency tree.
+    """
+    # Hashing the source file is blocking I/O too
+    cache_path = await asyncio.to_thread(_cache_path, func, max_depth, cache_dir)
+    if cache_path is not None and (
+        tree := await asyncio.to_thread(_load_cached_tree, cache_path)
+    ):
+        return tree
+
+    walk = _walk_tree(func, max_depth)
+    try:
+        jobs = next(walk)
+        while True:
+            results = await asyncio.gather(*map(asyncio.to_thread, jobs))
+            jobs = walk.send(results)
+    except StopIteration as stop:
+        tree, resolutions = stop.value
+
+    if cache_path is not None:
+        await asyncio.to_thread(_store_cached_tree, cache_path, tree, resolutions)
+    return tree
+
+
+def _walk_tree(
+    func: Callable, max_depth: int
+) -> Generator[
+    list[Callable[[], Any]], list[Any], tuple[FunctionInfo, list[_Resolution]]
+]:
+    """Walk the dependency tree of a function, one level at a time.
+
+    The analysis of each level is handed to the caller as a batch of jobs, and
+    their results are sent back, so the sync and async builders share the walk
+    and only differ in how they run a batch.
+
+    Yields:
+        list[Callable]: Jobs building the nodes of the next level.
+
+    Returns:
+        tuple: (root of the dependency tree, how the calls of its nodes were resolved)
+    """
+    seen: _Seen = {}
+    resolutions: list[_Resolution] = []
+    frontier: _Frontier = [(func, None, 0)]
+    depth = 0
+
+    while frontier:
+        pending = _link_seen(frontier, seen)
+        if depth == 0:
+            # The first level only holds the root
+            (root_key,) = pending
+        nodes = yield [
+            functools.partial(_build_node, dep_func, depth < max_depth)
+            for dep_func, _ in pending.values()
+        ]
+        frontier = _attach_level(pending, nodes, depth, max_depth, seen, resolutions)
+        depth += 1
+
+    return seen[root_key], resolutions
+
+
+def default_cache_dir() -> Path:
+    """Get the suggested directory for the on-disk cache of dependency trees.
+
+    Returns:
+        Path: `$XDG_CACHE_HOME/suite`, or `~/.cache/suite` if it's not set
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "suite"
+
+
+def _cache_path(
+    func: Callable, max_depth: int, cache_dir: str | os.PathLike | None
+) -> Path | None:
+    """Get the file where the dependency tree of a function is cached.
+
+    The name includes a hash of the function's source file, so editing the file
+    moves its trees to new cache entries.
+
+    Returns:
+        Path | None: The cache file, or None if the tree can't be cached.
+    """
+    if cache_dir is None:
+        return None
+    try:
+        digest = _file_digest(extract_source_file(func))
+    except (TypeError, OSError):
+        return None
+    qualname = getattr(inspect.unwrap(func), "__qualname__", get_callable_name(func))
+    # Nested functions have "<locals>" in their qualname
+    qualname = re.sub(r"[^\w.]", "_", qualname)
+    return Path(cache_dir) / f"v{_CACHE_VERSION}_{digest}_{qualname}_{max_depth}.pkl"
+
+
+def _file_digest(path: str) -> str:
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+
+
+def _load_cached_tree(cache_path: Path) -> FunctionInfo | None:
+    """Load a cached dependency tree, if it would be built the same way again.
+
+    Its source files must be unchanged, and the calls of its nodes must still
+    resolve to the same functions (e.g. a package may re-export another one).
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            source_files, resolutions, tree = pickle.load(f)
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        TypeError,
+        ValueError,
+    ):
+        # A missing or unreadable cache entry just means building the tree again
+        return None
+
+    for source_file, (mtime, digest) in source_files.items():
+        try:
+            if os.stat(source_file).st_mtime_ns != mtime and (
+                _file_digest(source_file) != digest
+            ):
+                return None
+        except OSError:
+            return None
+
+    for module_name, function_calls, dep_keys in resolutions:
+        module = None
+        if module_name is not None:
+            module = sys.modules.get(module_name)
+            if module is None:
+                return None
+        resolved = resolve_function_calls(function_calls, module)
+        if resolved.keys() != dep_keys.keys() or any(
+            _func_key(dep_func) != dep_keys[name] for name, dep_func in resolved.items()
+        ):
+            return None
+    return tree
+
+
+def _store_cached_tree(
+    cache_path: Path, tree: FunctionInfo, resolutions: list[_Resolution]
+) -> None:
+    """Save a dependency tree, along with what's needed to validate it on load."""
+    # source file -> (modification time, hash of the contents)
+    source_files: dict[str, tuple[int, str]] = {}
+    nodes = [tree]
+    visited = set()
+    while nodes:
+        node = nodes.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        nodes.extend(node.dependencies)
+        if node.source_file is None or node.source_file in source_files:
+            continue
+        try:
+            source_files[node.source_file] = (
+                os.stat(node.source_file).st_mtime_ns,
+                _file_digest(node.source_file),
             )
+        except OSError:
+            # The tree couldn't be validated when loading it
+            return
 
-        # Mark this function as visited
-        visited.add(name)
-
-        # Find function calls to determine dependencies
-        function_calls = find_function_calls(func)
-        dependencies = []
-
-        for call in function_calls:
-            dep_func = get_function_by_name(call, inspect.getmodule(func))
-            if dep_func and callable(dep_func):
-                # Recursively get dependencies
-                dep_info = cls.from_func(
-                    dep_func, max_depth, current_depth + 1, visited
-                )
-                dependencies.append(dep_info)
-
-        return cls(
-            name=name,
-            docstring=docstring,
-            source=source,
-            source_file=source_file,
-            dependencies=dependencies,
+    # The cache is only an optimization, so failing to write it (e.g. read-only or
+    # full disk) must not fail the analysis
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((source_files, resolutions, tree), f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError):
+        if tmp_path is not None:
+            Path(tmp_path).unlink(missing_ok=True)
+
+
+def _link_seen(frontier: _Frontier, seen: _Seen) -> _Pending:
+    """Link the functions of a level that were already built to their parents.
+
+    Returns:
+        _Pending: The functions of the level that still have to be analyzed.
+    """
+    pending: _Pending = {}
+    for func, parent, index in frontier:
+        key = _func_key(func)
+        if key in pending:
+            pending[key][1].append((parent, index))
+        elif key in seen:
+            # Built at an earlier level, so linking it could close a cycle.
+            # Ancestors aren't tracked, so every revisit is cut short the same way.
+            parent.dependencies[index] = dataclasses.replace(seen[key], dependencies=[])
+        else:
+            pending[key] = (func, [(parent, index)])
+    return pending
+
+
+def _attach_level(
+    pending: _Pending,
+    nodes: list[tuple[FunctionInfo, frozenset[str]]],
+    depth: int,
+    max_depth: int,
+    seen: _Seen,
+    resolutions: list[_Resolution],
+) -> _Frontier:
+    """Attach the freshly built nodes of a level to their parents.
+
+    Returns:
+        _Frontier: The functions of the next level.
+    """
+    frontier: _Frontier = []
+    for (key, (func, slots)), (info, function_calls) in zip(pending.items(), nodes):
+        seen[key] = info
+        for parent, index in slots:
+            if parent is not None:
+                parent.dependencies[index] = info
+
+        # Stop going deeper if we've reached the maximum depth
+        if depth >= max_depth:
+            continue
+
+        module = inspect.getmodule(func)
+        resolved = resolve_function_calls(function_calls, module)
+        resolutions.append(
+            (
+                module.__name__ if module is not None else None,
+                function_calls,
+                {name: _func_key(dep_func) for name, dep_func in resolved.items()},
+            )
         )
+        dep_funcs = resolved.values()
+        # Every dependency fills its slot once the next level is processed, so
+        # the list is allocated at its final size
+        info.dependencies = [None] * len(dep_funcs)
+        frontier.extend(
+            (dep_func, info, index) for index, dep_func in enumerate(dep_funcs)
+        )
+    return frontier
+
+
+def _func_key(func: Callable) -> Hashable:
+    # A definition is identified by where it is, so functions sharing a name (e.g.
+    # methods or nested functions) don't collide. Code objects alone compare by
+    # value and would merge equal definitions from different files.
+    code = _code_of(func)
+    if code is not None:
+        return code.co_filename, code.co_firstlineno, code.co_qualname
+    return (
+        extract_source_file(func),
+        extract_line_number(func),
+        get_callable_name(func),
+    )
+
+
+def extract_function_info(func: Callable) -> FunctionInfo:
+    """Build the `FunctionInfo` of a single function, without its dependencies.
+
+    The source, file and line come from a single cached `inspect` lookup.
+
+    Args:
+        func (Callable): The function to analyze.
+
+    Returns:
+        FunctionInfo: The function information, with no dependencies.
+    """
+    return FunctionInfo(
+        name=get_callable_name(func),
+        docstring=extract_docstring(func),
+        source=extract_source(func),
+        source_file=extract_source_file(func),
+        line_number=extract_line_number(func),
+    )
+
+
+def _build_node(
+    func: Callable, find_calls: bool
+) -> tuple[FunctionInfo, frozenset[str]]:
+    """Build the node of a function, and find its calls if it will have children.
+
+    Nodes at the maximum depth are most of the tree, so they skip parsing.
+
+    Returns:
+        tuple: (node, names of the functions it calls)
+    """
+    info = extract_function_info(func)
+    if find_calls and info.source:
+        return info, _calls_in_source(info.source)
+    return info, frozenset()
+
+
+@functools.lru_cache(maxsize=4096)
+def _calls_in_source(source: str) -> frozenset[str]:
+    """Find the function calls in a function's source, memoized by the source.
+
+    Only the calls are kept, the parsed tree is dropped right away.
+    """
+    return frozenset(_calls_in_tree(_parse_source(source)))
 
 
-class FunctionCallVisitor(ast.NodeVisitor):
-    """AST visitor to find function calls within a function."""
+def _parse_source(source: str) -> ast.Module:
+    # Only methods and nested functions are indented, so most sources can skip
+    # the scan done by dedent
+    if source[0] in " \t":
+        source = textwrap.dedent(source)
+    return compile(source, "<unknown>", "exec", _AST_FLAGS)
 
-    def __init__(self):
-        self.function_calls: set[str] = set()
 
-    def visit_Call(self, node):
-        """Visit a function call node."""
-        if isinstance(node.func, ast.Name):
-            # Direct function call: func()
-            self.function_calls.add(node.func.id)
-        elif isinstance(node.func, ast.Attribute):
-            # Method call: obj.method()
-            if isinstance(node.func.value, ast.Name):
-                # Simple attribute: obj.method()
-                self.function_calls.add(f"{node.func.value.id}.{node.func.attr}")
+def _calls_in_tree(tree: ast.AST) -> set[str]:
+    """Find the function calls in a parsed tree.
 
-        # Continue visiting child nodes
-        self.generic_visit(node)
+    Calls are only recorded by name here. Whether a name refers to a builtin, a
+    standard library or a third-party function depends on what it resolves to in
+    the module, which is checked by `resolve_function_calls`.
+
+    Args:
+        tree (ast.AST): tree to search
+
+    Returns:
+        set[str]: set with the names of the functions called in the tree
+    """
+    calls: set[str] = set()
+    add = calls.add
+    # Compare classes with `is` instead of isinstance and skip NodeVisitor's
+    # per-node method dispatch, since this is the hot loop on big functions
+    for node in ast.walk(tree):
+        if node.__class__ is ast.Call:
+            called = node.func
+            if called.__class__ is ast.Name:
+                # Direct function call: func()
+                add(called.id)
+            elif (
+                called.__class__ is ast.Attribute and called.value.__class__ is ast.Name
+            ):
+                # Simple method call: obj.method()
+                add(f"{called.value.id}.{called.attr}")
+    return calls
 
 
 def extract_docstring(func: Callable) -> str | None:
@@ -159,6 +540,9 @@ def extract_docstring(func: Callable) -> str | None:
 
 
 def extract_source(func: Callable) -> str | None:
+    code = _code_of(func)
+    if code is not None:
+        return _inspect_bundle(code.co_filename, code)[0]
     try:
         return inspect.getsource(func)
     except:
@@ -166,12 +550,58 @@ def extract_source(func: Callable) -> str | None:
 
 
 def extract_source_file(func: Callable) -> str | None:
+    code = _code_of(func)
+    if code is not None:
+        return _inspect_bundle(code.co_filename, code)[1]
     try:
         return inspect.getfile(func)
     except TypeError:
         return None
 
 
+def extract_line_number(func: Callable) -> int | None:
+    code = _code_of(func)
+    if code is not None:
+        return _inspect_bundle(code.co_filename, code)[2]
+    try:
+        return inspect.getsourcelines(func)[1]
+    except (TypeError, OSError):
+        return None
+
+
+def _code_of(func: Callable) -> CodeType | None:
+    """Get the code object behind a function, looking through decorators."""
+    try:
+        return getattr(inspect.unwrap(func), "__code__", None)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _inspect_bundle(
+    source_file: str, code: CodeType
+) -> tuple[str | None, str, int | None]:
+    """Get the source, file and first line of a code object in one go.
+
+    `inspect` stats and tokenizes the whole file on every lookup, so functions
+    living in the same module would otherwise pay for it once per extract_*.
+    Code objects compare by value, ignoring their file, so the file is part of
+    the cache key.
+
+    Returns:
+        tuple: (source, source_file, line_number)
+    """
+    try:
+        lines, line_number = inspect.getsourcelines(code)
+    except (TypeError, OSError):
+        return None, source_file, None
+    source = "".join(lines)
+    if len(source) < _MAX_INTERNED_SOURCE:
+        # Functions with the same source (e.g. redefined or reloaded) share it
+        source = sys.intern(source)
+    return source, source_file, line_number
+
+
 def find_function_calls(func: Callable) -> set[str]:
     """Find all function calls within a function.
 
@@ -183,10 +613,7 @@ def find_function_calls(func: Callable) -> set[str]:
     """
     source = extract_source(func)
     if source:
-        tree = ast.parse(textwrap.dedent(source))
-        visitor = FunctionCallVisitor()
-        visitor.visit(tree)
-        return visitor.function_calls
+        return set(_calls_in_source(source))
     return set()
 
 
@@ -194,29 +621,74 @@ def get_function_by_name(name: str, module: object) -> Any | None:
     """Get a function object by name from a module.
 
     Args:
-        name (str): _description_
-        module (_type_): _description_
+        name (str): name of the function, possibly dotted (e.g. "module.function")
+        module (object): module where the name is looked up
 
     Returns:
-        Any | None: _description_
+        Any | None: the object the name refers to, or None if it can't be found
+            or lives in the standard library or a third-party package
     """
-    if hasattr(module, name):
-        return getattr(module, name)
-
-    # Handle dot notation (e.g., "module.function")
-    parts = name.split(".")
-    if len(parts) > 1:
+    if "." not in name:
+        obj = getattr(module, name, None)
+    else:
+        # Handle dot notation (e.g., "module.function")
         obj = module
-        for part in parts:
-            if hasattr(obj, part):
-                obj = getattr(obj, part)
-            else:
+        for part in _split_name(name):
+            obj = getattr(obj, part, None)
+            if obj is None:
                 return None
-        return obj
 
-    # Check if the function is imported from another module
-    for key, value in module.__dict__.items():
-        if key == name and callable(value):
-            return value
+    if obj is None or _is_external(obj):
+        return None
+    return obj
+
+
+def _is_external(obj: object) -> bool:
+    """Check whether an object comes from the stdlib or a third-party package."""
+    module = inspect.getmodule(obj)
+    if module is None:
+        return False
+    if module.__name__.partition(".")[0] in sys.stdlib_module_names:
+        return True
+    module_file = getattr(module, "__file__", None)
+    return module_file is not None and not _THIRD_PARTY_DIRS.isdisjoint(
+        Path(module_file).parts
+    )
 
-    return None
+
+def resolve_function_calls(
+    function_calls: Collection[str], module: object
+) -> dict[str, Callable]:
+    """Resolve the names of the functions called from a module, all at once.
+
+    Plain names are matched against the module namespace with a single set
+    intersection, dotted names go through `get_function_by_name`.
+
+    Args:
+        function_calls (Collection[str]): names of the called functions
+        module (object): module where the names are looked up
+
+    Returns:
+        dict[str, Callable]: the callables found, by name. Names that can't be
+            found or live in the stdlib or a third-party package are left out.
+    """
+    if module is None:
+        return {}
+
+    namespace = vars(module)
+    dotted = {name for name in function_calls if "." in name}
+    resolved = {
+        name: namespace[name]
+        for name in namespace.keys() & function_calls
+        if callable(namespace[name]) and not _is_external(namespace[name])
+    }
+    for name in dotted:
+        obj = get_function_by_name(name, module)
+        if obj is not None and callable(obj):
+            resolved[name] = obj
+    return resolved
+
+
+@functools.lru_cache(maxsize=8192)
+def _split_name(name: str) -> tuple[str, ...]:
+    return tuple(name.split("."))
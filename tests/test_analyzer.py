@@ -1,6 +1,17 @@
+import asyncio
+import importlib
+import json
+import pickle
+import sys
+import textwrap
+
 from suite.analyzer import (
     FunctionInfo,
+    build_dependency_tree,
+    build_dependency_tree_async,
+    extract_source_file,
     find_function_calls,
+    resolve_function_calls,
 )
 
 
@@ -25,6 +36,28 @@ def sample_function_e():
     sample_function_e()
 
 
+def sample_function_f():
+    print(len(json.dumps({})))
+    sample_function_a()
+
+
+class SampleClassA:
+    @staticmethod
+    def run():
+        sample_function_a()
+
+
+class SampleClassB:
+    @staticmethod
+    def run():
+        pass
+
+
+def sample_function_g():
+    SampleClassA.run()
+    SampleClassB.run()
+
+
 def test_function_info():
     func_info = FunctionInfo.from_func(sample_function_a)
     assert func_info.name == "sample_function_a"
@@ -49,6 +82,48 @@ def test_find_function_calls():
     assert len(calls) == 1
 
 
+def test_build_dependency_tree_skips_builtins_and_stdlib():
+    func_info = build_dependency_tree(sample_function_f)
+    assert [dep.name for dep in func_info.dependencies] == ["sample_function_a"]
+
+
+def _write_package(root, files):
+    for path, source in files.items():
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(textwrap.dedent(source))
+    importlib.invalidate_caches()
+
+
+def test_build_dependency_tree_shadowed_builtin_and_stdlib_names(tmp_path, monkeypatch):
+    _write_package(
+        tmp_path,
+        {
+            "shadowapp/__init__.py": "",
+            "shadowapp/email.py": """
+                def send(user):
+                    pass
+            """,
+            "shadowapp/notify.py": """
+                from shadowapp import email
+
+
+                def format(user):
+                    pass
+
+
+                def notify(user):
+                    email.send(user)
+                    format(user)
+            """,
+        },
+    )
+    monkeypatch.syspath_prepend(tmp_path)
+    notify = importlib.import_module("shadowapp.notify")
+
+    func_info = build_dependency_tree(notify.notify)
+    assert sorted(dep.name for dep in func_info.dependencies) == ["format", "send"]
+
+
 def test_build_dependency_tree():
     func_info = FunctionInfo.from_func(sample_function_c, max_depth=2)
     assert func_info.name == "sample_function_c"
@@ -70,3 +145,206 @@ def test_no_dependencies():
     func_info = FunctionInfo.from_func(sample_function_d, max_depth=2)
     assert func_info.name == "sample_function_d"
     assert func_info.dependencies == []
+
+
+def test_function_info_to_dict():
+    func_info = FunctionInfo.from_func(sample_function_b)
+    info_dict = func_info.to_dict()
+    assert info_dict["name"] == "sample_function_b"
+    assert info_dict["dependencies"][0]["name"] == "sample_function_a"
+
+
+def sample_function_left():
+    sample_function_a()
+
+
+def sample_function_right():
+    sample_function_a()
+
+
+def sample_function_diamond():
+    sample_function_left()
+    sample_function_right()
+
+
+def test_build_dependency_tree_shared_dependency():
+    func_info = build_dependency_tree(sample_function_diamond, max_depth=2)
+    left, right = func_info.dependencies
+    assert left.dependencies[0] is right.dependencies[0]
+    assert left.dependencies[0].name == "sample_function_a"
+
+
+def test_build_dependency_tree_async():
+    func_info = asyncio.run(build_dependency_tree_async(sample_function_c))
+    assert func_info == build_dependency_tree(sample_function_c)
+
+
+def test_resolve_function_calls():
+    module = sys.modules[__name__]
+    resolved = resolve_function_calls(
+        {"sample_function_a", "missing", "json.dumps"}, module
+    )
+    assert resolved == {"sample_function_a": sample_function_a}
+
+
+def test_build_dependency_tree_same_name_dependencies():
+    func_info = build_dependency_tree(sample_function_g)
+    assert [dep.name for dep in func_info.dependencies] == ["run", "run"]
+    assert len({dep.line_number for dep in func_info.dependencies}) == 2
+
+
+def test_build_dependency_tree_cache(tmp_path):
+    func_info = build_dependency_tree(sample_function_c, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+    cached_info = build_dependency_tree(sample_function_c, cache_dir=tmp_path)
+    assert cached_info == func_info
+    assert cached_info is not func_info
+
+
+def _write_equal_definitions(root):
+    source = """
+        def helper(x):
+            \"\"\"Check x.\"\"\"
+            return x
+    """
+    _write_package(
+        root,
+        {
+            "equal_a/__init__.py": "",
+            "equal_a/helpers.py": source,
+            "equal_b/__init__.py": "",
+            "equal_b/helpers.py": source,
+            "equal_main.py": """
+                from equal_a.helpers import helper as helper_a
+                from equal_b.helpers import helper as helper_b
+
+
+                def run():
+                    helper_a(1)
+                    helper_b(2)
+            """,
+        },
+    )
+
+
+def test_extract_source_file_equal_definitions(tmp_path, monkeypatch):
+    _write_equal_definitions(tmp_path)
+    monkeypatch.syspath_prepend(tmp_path)
+    helpers_a = importlib.import_module("equal_a.helpers")
+    helpers_b = importlib.import_module("equal_b.helpers")
+
+    assert extract_source_file(helpers_a.helper) == helpers_a.__file__
+    assert extract_source_file(helpers_b.helper) == helpers_b.__file__
+
+
+def test_build_dependency_tree_equal_definitions(tmp_path, monkeypatch):
+    _write_equal_definitions(tmp_path)
+    monkeypatch.syspath_prepend(tmp_path)
+    equal_main = importlib.import_module("equal_main")
+
+    func_info = build_dependency_tree(equal_main.run)
+    source_files = {dep.source_file for dep in func_info.dependencies}
+    assert len(func_info.dependencies) == 2
+    assert source_files == {
+        importlib.import_module("equal_a.helpers").__file__,
+        importlib.import_module("equal_b.helpers").__file__,
+    }
+
+
+def test_build_dependency_tree_cache_rejects_edited_dependency(tmp_path, monkeypatch):
+    _write_package(
+        tmp_path,
+        {
+            "cache_app/__init__.py": "",
+            "cache_app/dep.py": """
+                def dep():
+                    \"\"\"Old.\"\"\"
+            """,
+            "cache_app/main.py": """
+                from cache_app import dep
+
+
+                def run():
+                    dep.dep()
+            """,
+        },
+    )
+    monkeypatch.syspath_prepend(tmp_path)
+    main = importlib.import_module("cache_app.main")
+    cache_dir = tmp_path / "cache"
+
+    func_info = build_dependency_tree(main.run, cache_dir=cache_dir)
+    assert func_info.dependencies[0].docstring == "Old."
+
+    # Only the dependency's file changes, so the root's cache entry is the same
+    _write_package(
+        tmp_path,
+        {
+            "cache_app/dep.py": """
+                def dep():
+                    \"\"\"Brand new.\"\"\"
+            """
+        },
+    )
+    importlib.reload(importlib.import_module("cache_app.dep"))
+
+    func_info = build_dependency_tree(main.run, cache_dir=cache_dir)
+    assert func_info.dependencies[0].docstring == "Brand new."
+
+
+def test_build_dependency_tree_cache_rejects_changed_reexport(tmp_path, monkeypatch):
+    _write_package(
+        tmp_path,
+        {
+            "reexport_pkg/__init__.py": "from reexport_pkg.impl import helper\n",
+            "reexport_pkg/impl.py": """
+                def helper():
+                    \"\"\"Old impl.\"\"\"
+            """,
+            "reexport_pkg/impl2.py": """
+                def helper():
+                    \"\"\"New impl.\"\"\"
+            """,
+            "reexport_main.py": """
+                from reexport_pkg import helper
+
+
+                def run():
+                    helper()
+            """,
+        },
+    )
+    monkeypatch.syspath_prepend(tmp_path)
+    main = importlib.import_module("reexport_main")
+    cache_dir = tmp_path / "cache"
+
+    func_info = build_dependency_tree(main.run, cache_dir=cache_dir)
+    assert func_info.dependencies[0].docstring == "Old impl."
+
+    # No file of the tree changes, only what the package re-exports
+    _write_package(
+        tmp_path,
+        {"reexport_pkg/__init__.py": "from reexport_pkg.impl2 import helper\n"},
+    )
+    importlib.reload(importlib.import_module("reexport_pkg"))
+    main = importlib.reload(main)
+
+    func_info = build_dependency_tree(main.run, cache_dir=cache_dir)
+    assert func_info.dependencies[0].docstring == "New impl."
+
+
+def test_build_dependency_tree_cache_write_failure(tmp_path, monkeypatch):
+    not_a_dir = tmp_path / "file"
+    not_a_dir.write_text("")
+    func_info = build_dependency_tree(sample_function_c, cache_dir=not_a_dir / "suite")
+    assert func_info.name == "sample_function_c"
+
+    def failing_dump(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(pickle, "dump", failing_dump)
+    cache_dir = tmp_path / "cache"
+    func_info = build_dependency_tree(sample_function_c, cache_dir=cache_dir)
+    assert func_info.name == "sample_function_c"
+    assert list(cache_dir.iterdir()) == []